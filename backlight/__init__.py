@@ -8,7 +8,6 @@ from backlight.api import Xrandr
 from backlight.api import autoload
 from backlight.api import brightness
 from backlight.api import load
-from backlight.daemon import Daemon
 from backlight.exceptions import DoesNotExist
 from backlight.exceptions import DoesNotSupportAPI
 from backlight.exceptions import NoSupportedGraphicsCards
@@ -30,3 +29,16 @@ __all__ = [
     "LinuxBacklight",
     "Xrandr",
 ]
+
+
+def __getattr__(name: str):
+    """Imports the daemon on first access, so that the API
+    and the CLI do not pay for the daemon's imports.
+    """
+
+    if name == "Daemon":
+        from backlight.daemon import Daemon  # pylint: disable=C0415
+
+        return Daemon
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
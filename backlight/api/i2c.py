@@ -1,6 +1,8 @@
 """Dimming via i2c."""
 
+from functools import lru_cache
 from hashlib import sha1
+from pathlib import Path
 from subprocess import check_output
 
 from smbus import SMBus  # pylint: disable=E0611
@@ -13,26 +15,45 @@ __all__ = ["syshash", "PercentageMap", "I2CBacklight", "ChrontelCH7511B", "I2C_C
 
 
 CHRONTEL_CH7511B_VALUES = PercentageMap(range(1, 18), range(30, 101))
+CPUINFO = Path("/proc/cpuinfo")
 
 
+@lru_cache(maxsize=1)
 def syshash() -> str:
-    """Returns hashed PCI and CPU data."""
+    """Returns hashed PCI and CPU data.
+
+    The hardware does not change without a reboot, so the hash is cached.
+    """
 
     hasher = sha1()
     lspci = check_output("/usr/bin/lspci")
     hasher.update(lspci)
-    cpu_model = check_output(("/usr/bin/grep", "model", "/proc/cpuinfo"))
+    # Same as the output of "grep model /proc/cpuinfo".
+    cpu_model = b"".join(
+        line
+        for line in CPUINFO.read_bytes().splitlines(keepends=True)
+        if b"model" in line
+    )
     hasher.update(cpu_model)
     return hasher.hexdigest()
 
 
+@lru_cache(maxsize=8)
+def _open_smbus(bus: int) -> SMBus:
+    """Returns a shared SMBus handle for the given bus."""
+
+    return SMBus(bus)
+
+
 class I2CBacklight:
     """Dimming by I2C / SMBUS."""
 
+    __slots__ = ("smbus", "address", "offset", "values")
+
     def __init__(self, bus: int, address: int, offset: int, values: PercentageMap):
         """Sets the respective I2C configuration."""
         try:
-            self.smbus = SMBus(bus)
+            self.smbus = _open_smbus(bus)
         except FileNotFoundError:
             raise DoesNotExist() from None
 
@@ -61,20 +82,27 @@ class I2CBacklight:
     @property
     def percent(self):
         """Returns the current brightness in percent."""
-        range_ = self.values[self.raw]
-        return sum(range_) / len(range_)
+        return self.values.to_percent(self.raw)
 
     @percent.setter
     def percent(self, percent):
         """Returns the current brightness in percent."""
         if 0 <= percent <= 100:
-            self.raw = self.values.from_percent(percent)
+            raw = self.values.from_percent(percent)
+
+            # Skip the bus write if the register already holds the value.
+            if raw != self.raw:
+                self.raw = raw
         else:
             raise ValueError(f"Invalid percentage: {percent}.")
 
     def _read(self, address: int) -> int:
         """Reads the respective address."""
-        return self.smbus.read_i2c_block_data(self.address, address, 1)[0]
+        return self._read_block(address, 1)[0]
+
+    def _read_block(self, address: int, count: int) -> bytes:
+        """Reads count consecutive addresses in one transaction."""
+        return bytes(self.smbus.read_i2c_block_data(self.address, address, count))
 
     def _write(self, address: int, value: int):
         """Reads the respective address."""
@@ -84,6 +112,8 @@ class I2CBacklight:
 class ChrontelCH7511B(I2CBacklight):
     """Backlight API for Chrontel CH7511B."""
 
+    __slots__ = ()
+
     def __init__(self, bus=0):
         """Initializes the Chrontel CH7511B client."""
         super().__init__(bus, 0x21, 0x6E, CHRONTEL_CH7511B_VALUES)
@@ -8,7 +8,9 @@ in the respective folder.
 """
 from __future__ import annotations
 from contextlib import suppress
+from os import O_RDONLY, O_RDWR, close, open as os_open, pread, pwrite, scandir
 from pathlib import Path
+from select import POLLPRI, poll
 from typing import Iterator
 
 from backlight.exceptions import DoesNotExist
@@ -22,20 +24,74 @@ __all__ = ["LinuxBacklight"]
 BASEDIR = Path("/sys/class/backlight")
 
 
+def _read_once(path: Path) -> int:
+    """Reads an integer from a sysfs file with a single read."""
+
+    fd = os_open(path, O_RDONLY)
+
+    try:
+        return int(pread(fd, 32, 0))
+    finally:
+        close(fd)
+
+
 class LinuxBacklight:
     """Backlight handler for graphics cards."""
 
+    __slots__ = (
+        "_graphics_card",
+        "omit_actual",
+        "_path",
+        "_max_file",
+        "_setter_file",
+        "_getter_file",
+        "_max",
+        "_payloads",
+        "_getter_fd",
+        "_setter_fd",
+    )
+
     def __init__(self, graphics_card: str, *, omit_actual: bool = False):
         """Sets the respective graphics card."""
+        self._getter_fd = None
+        self._setter_fd = None
         self._graphics_card = graphics_card
         self.omit_actual = omit_actual
+        self._path = BASEDIR.joinpath(graphics_card)
+        self._max_file = self._path.joinpath("max_brightness")
+        self._setter_file = self._path.joinpath("brightness")
+
+        if omit_actual:
+            self._getter_file = self._setter_file
+        else:
+            self._getter_file = self._path.joinpath("actual_brightness")
 
-        if not self._path.exists():
-            raise DoesNotExist()
+        # Only stat() the device directory if its files are missing.
+        if not (
+            self._max_file.is_file()
+            and self._setter_file.is_file()
+            and (omit_actual or self._getter_file.is_file())
+        ):
+            if not self._path.exists():
+                raise DoesNotExist()
 
-        if not all(file.is_file() for file in self._files):
             raise DoesNotSupportAPI()
 
+        # The maximum brightness is constant for the device.
+        try:
+            self._max = _read_once(self._max_file)
+        except (OSError, ValueError):
+            raise DoesNotSupportAPI() from None
+
+        # Pre-format the raw values to write for each percentage.
+        self._payloads = tuple(
+            b"%d\n" % (self._max * percent // 100) for percent in range(101)
+        )
+
+    def __del__(self):
+        """Closes the brightness files."""
+        self.close()
+
     def __str__(self):
         """Returns the respective graphics card's name."""
         return self._graphics_card
@@ -43,9 +99,14 @@ class LinuxBacklight:
     @classmethod
     def all(cls, *, omit_actual: bool = False) -> Iterator[LinuxBacklight]:
         """Seeks BASEDIR for available graphics card and yields them."""
-        for graphics_card in BASEDIR.iterdir():
-            with suppress(DoesNotExist, DoesNotSupportAPI):
-                yield cls(str(graphics_card), omit_actual=omit_actual)
+        with scandir(BASEDIR) as entries:
+            for entry in entries:
+                # Device entries are symlinks to directories.
+                if not entry.is_dir():
+                    continue
+
+                with suppress(DoesNotExist, DoesNotSupportAPI):
+                    yield cls(entry.name, omit_actual=omit_actual)
 
     @classmethod
     def any(cls, *, omit_actual: bool = False) -> LinuxBacklight:
@@ -57,63 +118,105 @@ class LinuxBacklight:
 
         raise NoSupportedGraphicsCards()
 
-    @property
-    def _path(self):
-        """Returns the absolute path to the
-        graphics card's device folder.
+    def fileno(self) -> int:
+        """Returns the file descriptor of the brightness file to read.
+
+        The kernel signals changes of actual_brightness on it via POLLPRI.
         """
-        return BASEDIR.joinpath(self._graphics_card)
+        return self._getter()
 
-    @property
-    def _max_file(self):
-        """Returns the path of the maximum brightness file."""
-        return self._path.joinpath("max_brightness")
+    def _getter(self) -> int:
+        """Returns the file descriptor to read the brightness from."""
+        if self._getter_fd is None:
+            self._getter_fd = os_open(self._getter_file, O_RDONLY)
 
-    @property
-    def _setter_file(self):
-        """Returns the path of the backlight file."""
-        return self._path.joinpath("brightness")
+        return self._getter_fd
 
-    @property
-    def _getter_file(self):
-        """Returns the file to read the current brightness from."""
-        if self.omit_actual:
-            return self._setter_file
+    def _setter(self) -> int:
+        """Returns the file descriptor to read and write
+        the requested brightness.
+        """
+        if self._setter_fd is None:
+            self._setter_fd = os_open(self._setter_file, O_RDWR)
 
-        return self._path.joinpath("actual_brightness")
+        return self._setter_fd
 
-    @property
-    def _files(self):
-        """Yields the graphics cards API's files."""
-        return (self._max_file, self._setter_file, self._getter_file)
+    def _write(self, raw: int, payload: bytes) -> None:
+        """Writes the raw brightness unless it is already requested.
+
+        The requested brightness is read freshly, so that changes
+        made elsewhere are never mistaken for the current value.
+        """
+        fd = self._setter()
+
+        if int(pread(fd, 32, 0)) != raw:
+            pwrite(fd, payload, 0)
+
+    def close(self) -> None:
+        """Closes the brightness files.
+
+        They will be re-opened on the next access.
+        """
+        if self._getter_fd is not None:
+            close(self._getter_fd)
+            self._getter_fd = None
+
+        if self._setter_fd is not None:
+            close(self._setter_fd)
+            self._setter_fd = None
+
+    def watch(self, timeout: float = None) -> Iterator[int]:
+        """Yields the raw brightness whenever it changes.
+
+        Some drivers do not notify about changes, so with a timeout
+        in seconds the brightness is also re-read after each timeout.
+        The kernel only notifies about changes of actual_brightness,
+        so a timeout is required with omit_actual.
+        """
+        if self.omit_actual and timeout is None:
+            raise ValueError("A timeout is required with omit_actual.")
+
+        return self._watch(timeout)
+
+    def _watch(self, timeout: float = None) -> Iterator[int]:
+        """Yields the raw brightness whenever it changes."""
+        events = poll()
+        events.register(self, POLLPRI)
+        timeout = None if timeout is None else timeout * 1000
+        last = None
+
+        while True:
+            events.poll(timeout)
+
+            # Reading the brightness re-arms the notification.
+            if (raw := self.raw) != last:
+                yield raw
+                last = raw
 
     @property
     def max(self):
         """Returns the maximum brightness as integer."""
-        with self._max_file.open("r") as file:
-            return int(file.read().strip())
+        return self._max
 
     @property
     def raw(self):
         """Returns the raw brightness."""
-        with self._getter_file.open("r") as file:
-            return int(file.read().strip())
+        return int(pread(self._getter(), 32, 0))
 
     @raw.setter
     def raw(self, brightness):
         """Sets the raw brightness."""
-        with self._setter_file.open("w") as file:
-            file.write(f"{brightness}\n")
+        self._write(brightness, b"%d\n" % brightness)
 
     @property
     def percent(self):
         """Returns the current brightness in percent."""
-        return self.raw * 100 // self.max
+        return self.raw * 100 // self._max
 
     @percent.setter
     def percent(self, percent):
         """Returns the current brightness in percent."""
         if 0 <= percent <= 100:
-            self.raw = self.max * percent // 100
+            self._write(self._max * percent // 100, self._payloads[percent])
         else:
             raise ValueError(f"Invalid percentage: {percent}.")
@@ -1,8 +1,8 @@
 """Backlight setting via xrandr."""
 
-from contextlib import suppress
 from os import environ
-from subprocess import check_output
+from re import MULTILINE, compile as re_compile
+from subprocess import CalledProcessError, check_output
 
 from backlight.exceptions import NoOutputFound
 
@@ -10,12 +10,15 @@ from backlight.exceptions import NoOutputFound
 __all__ = ["Xrandr"]
 
 
+# Brightness property line within the properties following an output line.
+BRIGHTNESS = re_compile(rb"(?:\n[ \t].*)*?\n\tBrightness:(.*)")
+CONNECTED_OUTPUT = re_compile(rb"^(\S+) connected(?!\S).*$", MULTILINE)
 XRANDR = "/usr/bin/xrandr"
 
 
 def _xrandr(
     display: int, verbose: bool = False, output: str = None, brightness: int = None
-) -> str:
+) -> bytes:
     """Runs the respective xrandr command."""
 
     command = [XRANDR]
@@ -31,79 +34,55 @@ def _xrandr(
         command.append("--brightness")
         command.append(brightness)
 
-    with Display(display):
-        return check_output(command, text=True)
+    return check_output(command, env={**environ, "DISPLAY": f":{display}"})
 
 
 def _get_output(display: int) -> str:
     """Determines the active output."""
 
-    for line in _xrandr(display).split("\n"):
-        if "connected" in line:
-            output, state, *_ = line.split()
-
-            if state == "connected":
-                return output
+    if match := CONNECTED_OUTPUT.search(_xrandr(display)):
+        return match.group(1).decode()
 
     raise NoOutputFound()
 
 
 def _get_brightness(display: int) -> float:
-    """Determines the active output."""
-
-    active_output = _get_output(display)
-    output = None
+    """Determines the brightness of the active output."""
 
-    for line in _xrandr(display, verbose=True).split("\n"):
-        if output == active_output and line.startswith("\t"):
-            try:
-                key, value = line.split(":", maxsplit=1)
-            except ValueError:
-                continue
+    output = _xrandr(display, verbose=True)
 
-            if key.strip() == "Brightness":
-                return float(value.strip())
-        else:
-            with suppress(ValueError):
-                output, _ = line.split(maxsplit=1)
+    if (match := CONNECTED_OUTPUT.search(output)) and (
+        match := BRIGHTNESS.match(output, match.end())
+    ):
+        return float(match.group(1))
 
     return None
 
 
-class Display(int):
-    """Context manager for setting and un-setting
-    DISPLAY environment variable.
-    """
-
-    def __init__(self, *_):
-        """Sets the previous display."""
-        super().__init__()
-        self._previous = None
-
-    def __str__(self):
-        """Returns a colon, followed by the display ID."""
-        return f":{int(self)}"
-
-    def __enter__(self):
-        """Stores the previously set display and sets the
-        DISPLAY environment variable to the current display.
-        """
-        self._previous, environ["DISPLAY"] = environ.get("DISPLAY"), str(self)
-
-    def __exit__(self, *_):
-        """Resets the DISPLAY environment variable."""
-        if self._previous is None:
-            del environ["DISPLAY"]
-        else:
-            environ["DISPLAY"] = self._previous
-
-
 class Xrandr:
     """Backlight client using xrandr."""
 
+    __slots__ = ("display", "_output")
+
     def __init__(self, display: int = 0):
         """Sets the display to use."""
         self.display = display
+        self._output = None
+
+    @property
+    def output(self) -> str:
+        """Returns the active output.
+
+        It is determined once and cached until invalidated.
+        """
+        if self._output is None:
+            self._output = _get_output(self.display)
+
+        return self._output
+
+    def invalidate(self) -> None:
+        """Forgets the active output, e.g. after hotplugging."""
+        self._output = None
 
     @property
     def raw(self):
@@ -113,8 +92,17 @@ class Xrandr:
     @raw.setter
     def raw(self, value):
         """Sets the raw value."""
-        output = _get_output(self.display)
-        _xrandr(self.display, output=output, brightness=str(value))
+        cached = self._output is not None
+
+        try:
+            _xrandr(self.display, output=self.output, brightness=str(value))
+        except CalledProcessError:
+            if not cached:
+                raise
+
+            # The cached output may be gone, e.g. after hotplugging.
+            self.invalidate()
+            _xrandr(self.display, output=self.output, brightness=str(value))
 
     @property
     def percent(self):
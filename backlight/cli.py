@@ -2,10 +2,14 @@
 and set the screen's backlight brightnesss.
 """
 from argparse import ArgumentParser, Namespace
+from contextlib import suppress
 from logging import INFO, basicConfig, getLogger
+from os import environ
 from pathlib import Path
+from typing import Optional
 
-from backlight.api import load, GraphicsCard
+from backlight.api import load, GraphicsCard, LinuxBacklight
+from backlight.exceptions import DoesNotExist, DoesNotSupportAPI
 from backlight.exceptions import NoSupportedGraphicsCards
 from backlight.types import IntegerDifferential
 
@@ -14,10 +18,46 @@ __all__ = ["main"]
 
 
 BACKUP_FILE = Path("/etc/backlight")
+CACHE_FILE = "backlight-card"
 LOG_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
 LOGGER = getLogger("brightness")
 
 
+def get_cache_file() -> Optional[Path]:
+    """Returns the per-session graphics card cache file, if any."""
+
+    if runtime_dir := environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir, CACHE_FILE)
+
+    return None
+
+
+def load_graphics_card(name: str = None, *, omit_actual: bool = False) -> GraphicsCard:
+    """Loads the graphics card.
+
+    An automatically detected sysfs graphics card is cached
+    for the session, so that it need not be detected again.
+    """
+
+    if name is not None or (cache_file := get_cache_file()) is None:
+        return load(name, omit_actual=omit_actual)
+
+    with suppress(OSError, DoesNotExist, DoesNotSupportAPI):
+        cached = cache_file.read_text()
+
+        # Only accept device names, not paths outside of BASEDIR.
+        if cached == Path(cached).name and cached not in {"", ".", ".."}:
+            return LinuxBacklight(cached, omit_actual=omit_actual)
+
+    graphics_card = load(omit_actual=omit_actual)
+
+    if isinstance(graphics_card, LinuxBacklight):
+        with suppress(OSError):
+            cache_file.write_text(str(graphics_card))
+
+    return graphics_card
+
+
 def _set_value(
     graphics_card: GraphicsCard, value: IntegerDifferential, *, raw: bool = False
 ) -> None:
@@ -125,7 +165,9 @@ def main() -> int:
     basicConfig(level=INFO, format=LOG_FORMAT)
 
     try:
-        graphics_card = load(args.graphics_card, omit_actual=args.omit_actual)
+        graphics_card = load_graphics_card(
+            args.graphics_card, omit_actual=args.omit_actual
+        )
     except NoSupportedGraphicsCards:
         LOGGER.error("No supported graphics cards found.")
         return 3
@@ -2,17 +2,32 @@
 at given timestamps to the respective value.
 """
 from argparse import ArgumentParser, Namespace
-from contextlib import suppress
-from datetime import datetime
-from json import load
-from logging import DEBUG, INFO, basicConfig, getLogger
+from array import array
+from bisect import bisect_right
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, time, timedelta
+from logging import DEBUG, INFO, Formatter, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+from math import isfinite
+from os import O_CLOEXEC, O_NONBLOCK, SCHED_IDLE, close, pipe2, read
+from os import sched_param, sched_setscheduler, stat
 from pathlib import Path
-from time import sleep
-from typing import Iterable
-
-from backlight.api import load as load_backlight, GraphicsCard
+from queue import SimpleQueue
+from select import POLLPRI, poll
+from signal import SIGINT, SIGTERM, Signals, set_wakeup_fd, signal
+from time import localtime
+from typing import Iterable, Iterator, Optional, Sequence
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+from backlight.api import load as load_backlight, GraphicsCard, LinuxBacklight
 from backlight.types import TimedBrightness
 from backlight.exceptions import NoLatestEntry, NoSupportedGraphicsCards
+from backlight.inotify import IN_CLOSE_WRITE, IN_MOVED_TO, Inotify
+from backlight.timer import Timer
 
 
 __all__ = [
@@ -20,39 +35,45 @@ __all__ = [
     "DEFAULT_CONFIG",
     "NoLatestEntry",
     "stripped_datetime",
+    "minute_of_day",
+    "current_minute",
+    "format_minute",
+    "config_mtime",
+    "parse_minute",
     "load_config",
     "parse_config",
+    "seconds",
+    "parse_tick",
+    "get_schedule",
     "get_latest",
+    "get_next",
     "main",
     "Daemon",
 ]
 
 
 DEFAULT_CONFIG = Path("/etc/backlight.json")
+IDLE_TIMEOUT = 86400
+MINUTES_PER_DAY = 1440
+MIN_TICK = 1.0
 LOG_FORMAT = "[%(levelname)s] %(name)s: %(message)s"
 LOGGER = getLogger("backlightd")
+TERMINATION_SIGNALS = (SIGINT, SIGTERM)
+TICK_KEY = "__tick__"
 TIME_FORMAT = "%H:%M"
 
 
 def stripped_datetime(timestamp: datetime = None) -> datetime:
     """Gets current date time, exact to minute."""
 
-    timestamp = timestamp or datetime.now()
-    return datetime(
-        year=timestamp.year,
-        month=timestamp.month,
-        day=timestamp.day,
-        hour=timestamp.hour,
-        minute=timestamp.minute,
-    )
+    return (timestamp or datetime.now()).replace(second=0, microsecond=0)
 
 
 def load_config(path: Path) -> dict:
     """Loads the configuration"""
 
     try:
-        with path.open("r") as config_file:
-            return load(config_file)
+        return loads(path.read_bytes())
     except PermissionError:
         LOGGER.error("Cannot read config file: %s.", path)
     except FileNotFoundError:
@@ -63,55 +84,171 @@ def load_config(path: Path) -> dict:
     return {}
 
 
+def config_mtime(path: Path) -> Optional[int]:
+    """Returns the config file's modification time in nanoseconds."""
+
+    try:
+        return stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def minute_of_day(timestamp: datetime) -> int:
+    """Returns the minute of the day of the given timestamp."""
+
+    return timestamp.hour * 60 + timestamp.minute
+
+
+def current_minute() -> int:
+    """Returns the current minute of the day."""
+
+    now = localtime()
+    return now.tm_hour * 60 + now.tm_min
+
+
+def format_minute(minute: int) -> str:
+    """Formats the minute of the day as HH:MM."""
+
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def parse_minute(timestamp: str) -> int:
+    """Parses a timestamp in TIME_FORMAT into the minute of the day."""
+
+    hour, separator, minute = timestamp.partition(":")
+
+    # Accept the same digits only as strptime() with TIME_FORMAT would.
+    if not separator or not all(
+        part.isascii() and part.isdigit() and len(part) <= 2 for part in (hour, minute)
+    ):
+        raise ValueError(f"Invalid timestamp: {timestamp}")
+
+    hour, minute = int(hour), int(minute)
+
+    if 0 <= hour < 24 and 0 <= minute < 60:
+        return hour * 60 + minute
+
+    raise ValueError(f"Invalid timestamp: {timestamp}")
+
+
 def parse_config(config: dict) -> Iterable[TimedBrightness]:
-    """Parses the configuration dictionary."""
+    """Parses the configuration dictionary.
+
+    The timestamps are converted into minutes of the day.
+    """
+
+    for key, brightness in config.items():
+        if key == TICK_KEY:
+            continue
 
-    for timestamp, brightness in config.items():
         try:
-            timestamp = datetime.strptime(timestamp, TIME_FORMAT).time()
+            timestamp = parse_minute(key)
         except ValueError:
-            LOGGER.error('Invalid timestamp "%s".', timestamp)
+            LOGGER.error('Invalid timestamp "%s".', key)
             continue
 
-        timestamp = timestamp.strftime(TIME_FORMAT)
-
         try:
             brightness = int(brightness)
         except (TypeError, ValueError):
             LOGGER.error('Invalid brightness "%s".', brightness)
-            LOGGER.debug('At "%s".', timestamp)
+            LOGGER.debug('At "%s".', key)
             continue
 
         if 0 <= brightness <= 100:
             yield TimedBrightness(timestamp, brightness)
         else:
             LOGGER.error('Invalid percentage "%s".', brightness)
-            LOGGER.debug('At "%s".', timestamp)
+            LOGGER.debug('At "%s".', key)
 
 
-def get_latest(config: dict) -> TimedBrightness:
-    """Returns the last config entry from the provided configuration."""
+def seconds(value) -> float:
+    """Parses a tick in seconds, clamped to MIN_TICK and IDLE_TIMEOUT.
 
-    now = stripped_datetime().time()
-    sorted_values = sorted(config.items())
-    latest = None
+    The daemon never sleeps longer than IDLE_TIMEOUT anyway.
+    """
 
-    for timestamp, brightness in sorted_values:
-        if timestamp <= now:
-            latest = TimedBrightness(timestamp, brightness)
-        else:
-            # Since values are sorted by timestamp,
-            # stop seeking if timstamp is in the future.
-            break
+    if isfinite(tick := float(value)) and tick > 0:
+        return min(max(tick, MIN_TICK), IDLE_TIMEOUT)
 
-    # Fall back to latest value (of previous day).
-    if latest is None:
-        try:
-            return sorted_values[-1]
-        except IndexError:
-            raise NoLatestEntry() from None
+    raise ValueError(f"Invalid tick: {value}")
+
+
+def parse_tick(config: dict) -> Optional[float]:
+    """Returns the tick in seconds from the configuration, if set."""
 
-    return latest
+    if (tick := config.get(TICK_KEY)) is None:
+        return None
+
+    try:
+        return seconds(tick)
+    except (TypeError, ValueError):
+        LOGGER.error('Invalid tick "%s".', tick)
+        return None
+
+
+def get_schedule(timestamps: Sequence[int]) -> array:
+    """Returns the active config timestamp for each minute of the day.
+
+    The timestamps must be the sorted keys of the configuration.
+    """
+
+    if not timestamps:
+        return array("H")
+
+    # Minutes before the first entry use the latest one of the previous day.
+    schedule = array("H", [timestamps[-1]]) * MINUTES_PER_DAY
+
+    for start, end in zip(timestamps, [*timestamps[1:], MINUTES_PER_DAY]):
+        schedule[start:end] = array("H", [start]) * (end - start)
+
+    return schedule
+
+
+def get_latest(
+    config: dict, now: datetime = None, schedule: array = None
+) -> TimedBrightness:
+    """Returns the last config entry from the provided configuration.
+
+    If provided, schedule must be the configuration's schedule.
+    """
+
+    if schedule is None:
+        schedule = get_schedule(sorted(config))
+
+    if not schedule:
+        raise NoLatestEntry()
+
+    timestamp = schedule[current_minute() if now is None else minute_of_day(now)]
+    return TimedBrightness(timestamp, config[timestamp])
+
+
+def get_next(
+    config: dict, now: datetime = None, timestamps: Sequence[int] = None
+) -> datetime:
+    """Returns the date and time of the next config entry.
+
+    If provided, timestamps must be the sorted keys of the configuration.
+    """
+
+    now = now or datetime.now()
+
+    if timestamps is None:
+        timestamps = sorted(config)
+
+    if not timestamps:
+        raise NoLatestEntry()
+
+    index = bisect_right(timestamps, minute_of_day(now))
+
+    if index < len(timestamps):
+        date = now.date()
+        timestamp = timestamps[index]
+    else:
+        # Wrap around to the first entry of the next day.
+        date = now.date() + timedelta(days=1)
+        timestamp = timestamps[0]
+
+    return datetime.combine(date, time(*divmod(timestamp, 60)))
 
 
 def get_args() -> Namespace:
@@ -131,9 +268,8 @@ def get_args() -> Namespace:
         "-t",
         "--tick",
         metavar="seconds",
-        type=float,
-        default=1,
-        help="sets the daemon's interval",
+        type=seconds,
+        help="sets the daemon's maximum sleep interval (overrides __tick__)",
     )
     parser.add_argument(
         "-r",
@@ -141,59 +277,209 @@ def get_args() -> Namespace:
         action="store_true",
         help="reset the brightness before terminating",
     )
+    parser.add_argument(
+        "-l",
+        "--low-priority",
+        action="store_true",
+        help="run with the idle scheduling policy",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="turn on verbose logging"
     )
     return parser.parse_args()
 
 
+@contextmanager
+def background_logging(level: int) -> Iterator[None]:
+    """Writes log records from a background thread,
+    so that the daemon never blocks on stderr.
+    """
+
+    queue = SimpleQueue()
+    handler = StreamHandler()
+    handler.setFormatter(Formatter(LOG_FORMAT))
+    listener = QueueListener(queue, handler)
+    queue_handler = QueueHandler(queue)
+    logger = getLogger()
+    previous_level = logger.level
+    logger.setLevel(level)
+    logger.addHandler(queue_handler)
+    listener.start()
+
+    try:
+        yield
+    finally:
+        logger.removeHandler(queue_handler)
+        logger.setLevel(previous_level)
+        listener.stop()
+
+
+def _ignore(*_) -> None:
+    """Handles signals that are processed via the wakeup file descriptor."""
+
+
+@contextmanager
+def termination_signals() -> Iterator[int]:
+    """Yields a file descriptor that becomes readable
+    with the numbers of received termination signals.
+    """
+
+    read_fd, write_fd = pipe2(O_NONBLOCK | O_CLOEXEC)
+    handlers = {signum: signal(signum, _ignore) for signum in TERMINATION_SIGNALS}
+    previous_fd = set_wakeup_fd(write_fd, warn_on_full_buffer=False)
+
+    try:
+        yield read_fd
+    finally:
+        set_wakeup_fd(previous_fd)
+
+        for signum, handler in handlers.items():
+            signal(signum, handler)
+
+        close(read_fd)
+        close(write_fd)
+
+
 def main():
     """Runs as a daemon."""
 
     args = get_args()
-    basicConfig(level=DEBUG if args.debug else INFO, format=LOG_FORMAT)
-    backlight = load_backlight(args.graphics_card)
-    config = dict(parse_config(load_config(args.config_file)))
 
-    try:
-        daemon = Daemon(backlight, config, reset=args.reset, tick=args.tick)
-    except NoSupportedGraphicsCards:
-        LOGGER.error("No supported graphics cards found.")
-        return 3
+    with background_logging(DEBUG if args.verbose else INFO):
+        if args.low_priority:
+            sched_setscheduler(0, SCHED_IDLE, sched_param(0))
+
+        json = load_config(args.config)
+        config = dict(parse_config(json))
 
-    if daemon.spawn():
-        return 0
+        try:
+            backlight = load_backlight(args.graphics_card)
+        except NoSupportedGraphicsCards:
+            LOGGER.error("No supported graphics cards found.")
+            return 3
+
+        daemon = Daemon(
+            backlight,
+            config,
+            reset=args.reset,
+            tick=parse_tick(json) if args.tick is None else args.tick,
+            config_file=args.config,
+            fixed_tick=args.tick is not None,
+        )
 
-    return 1
+        if daemon.spawn():
+            return 0
+
+        return 1
 
 
 class Daemon:
     """A screen backlight daemon."""
 
+    __slots__ = (
+        "_backlight",
+        "_brightness",
+        "_config",
+        "_timestamps",
+        "_schedule",
+        "reset",
+        "tick",
+        "_initial_brightness",
+        "_last",
+        "config_file",
+        "fixed_tick",
+        "_config_mtime",
+    )
+
     def __init__(
-        self, backlight: GraphicsCard, config: dict, reset: bool = False, tick: int = 1
+        self,
+        backlight: GraphicsCard,
+        config: dict,
+        reset: bool = False,
+        tick: float = None,
+        config_file: Path = None,
+        fixed_tick: bool = False,
     ):
         """Tries the specified graphics cards until
         a working one is found.
 
         If none are specified, tries all graphics cards
         within BASEDIR until a working one is found.
+
+        If a config file is given, the config is reloaded when it changes.
+        Unless fixed_tick is set, this also reloads the tick.
         """
         self._backlight = backlight
+        self._brightness = None
         self.config = config
         self.reset = reset
         self.tick = tick
         self._initial_brightness = self.brightness
         self._last = None
+        self.config_file = config_file
+        self.fixed_tick = fixed_tick
+        self._config_mtime = None if config_file is None else config_mtime(config_file)
+
+    @property
+    def config(self) -> dict:
+        """Returns the configuration."""
+        return self._config
+
+    @config.setter
+    def config(self, config: dict):
+        """Sets the configuration and pre-computes its schedule."""
+        self._config = config
+        self._timestamps = tuple(sorted(config))
+        self._schedule = get_schedule(self._timestamps)
+
+    @property
+    def notified(self) -> bool:
+        """Returns whether the backlight notifies about brightness changes."""
+        return (
+            isinstance(self._backlight, LinuxBacklight)
+            and not self._backlight.omit_actual
+        )
 
     @property
     def brightness(self):
-        """Returns the current brightness."""
-        return self._backlight.percent
+        """Returns the current brightness.
+
+        If the backlight notifies about changes, the value is cached,
+        since the daemon sets it itself and refreshes it on notifications.
+        """
+        if self._brightness is None or not self.notified:
+            self._brightness = self._backlight.percent
+
+        return self._brightness
 
     @brightness.setter
     def brightness(self, percent):
         """Sets the current brightness."""
+        self.set_brightness(percent)
+
+    def _is_set(self, percent: int) -> bool:
+        """Checks whether a sysfs backlight already has the brightness.
+
+        The raw brightness is read freshly, since not all drivers
+        notify about changes made elsewhere.
+        """
+        if not isinstance(self._backlight, LinuxBacklight) or not 0 <= percent <= 100:
+            return False
+
+        try:
+            return self._backlight.raw == self._backlight.max * percent // 100
+        except (OSError, ValueError):
+            return False
+
+    def set_brightness(self, percent: int, *, force: bool = False) -> None:
+        """Sets the current brightness.
+
+        Unless forced, the write is skipped if the brightness is already set.
+        """
+        if not force and self._is_set(percent):
+            LOGGER.debug("Brightness is already %s%%.", percent)
+            return
+
         try:
             self._backlight.percent = percent
         except ValueError:
@@ -202,50 +488,152 @@ class Daemon:
             LOGGER.error("Cannot set brightness.")
             LOGGER.info("Is this service running as root?")
         else:
+            self._brightness = percent
             LOGGER.info("Set brightness to %s%%.", percent)
 
     def _startup(self):
         """Starts up the daemon."""
         LOGGER.info("Starting up...")
-        LOGGER.info("Tick is %s second(s).", self.tick)
+
+        if self.tick is not None:
+            LOGGER.info("Tick is %s second(s).", self.tick)
+
         LOGGER.info("Detected graphics card: %s.", self._backlight)
         LOGGER.info("Initial brightness is %s%%.", self._initial_brightness)
 
         try:
-            timestamp, self.brightness = get_latest(self.config)
+            self._last, brightness = get_latest(self.config, schedule=self._schedule)
         except NoLatestEntry:
             LOGGER.error("Latest entry could not be determined.")
             LOGGER.error("Falling back to 100%.")
-            self.brightness = 100
+            self.set_brightness(100)
         else:
-            timestamp = timestamp.strftime(TIME_FORMAT)
+            self.set_brightness(brightness)
+            timestamp = format_minute(self._last)
             LOGGER.info("Loaded latest setting from %s.", timestamp)
 
     def _shutdown(self):
         """Performs shutdown tasks."""
         if self.reset:
             LOGGER.info("Resetting brightness...")
-            self.brightness = self._initial_brightness
+            self.set_brightness(self._initial_brightness, force=True)
 
         LOGGER.info("Terminating...")
         return True
 
+    def _deadline(self) -> datetime:
+        """Returns the date and time to sleep until."""
+        now = datetime.now()
+
+        if self._timestamps:
+            deadline = get_next(self.config, now, self._timestamps)
+        else:
+            deadline = now + timedelta(seconds=IDLE_TIMEOUT)
+
+        if self.tick is None:
+            return deadline
+
+        return min(deadline, now + timedelta(seconds=self.tick))
+
+    def _update(self):
+        """Applies the latest config entry if it changed."""
+        if not self._schedule:
+            return
+
+        timestamp = self._schedule[current_minute()]
+
+        if timestamp != self._last:
+            self.set_brightness(self.config[timestamp])
+            self._last = timestamp
+
+    def _reload(self):
+        """Reloads the config if the config file was modified."""
+        if (mtime := config_mtime(self.config_file)) == self._config_mtime:
+            return
+
+        self._config_mtime = mtime
+        LOGGER.info("Reloading config file: %s.", self.config_file)
+        json = load_config(self.config_file)
+        self.config = dict(parse_config(json))
+        self._last = None
+
+        if not self.fixed_tick:
+            self.tick = parse_tick(json)
+
+    def _changed(self):
+        """Handles a change of the actual brightness."""
+        # Reading the brightness re-arms the sysfs notification.
+        self._brightness = self._backlight.percent
+        LOGGER.debug("Brightness changed to %s%%.", self._brightness)
+
+    def _watch_config(self) -> Optional[Inotify]:
+        """Returns an inotify instance watching the config file, if possible."""
+        if self.config_file is None:
+            return None
+
+        inotify = None
+
+        # Watch the directory, since editors replace the file on saving.
+        try:
+            inotify = Inotify()
+            inotify.watch(self.config_file.parent, IN_CLOSE_WRITE | IN_MOVED_TO)
+        except OSError as error:
+            if inotify is not None:
+                inotify.close()
+
+            LOGGER.warning("Cannot watch config file: %s", error)
+            LOGGER.warning("Config changes will not be reloaded.")
+            return None
+
+        return inotify
+
+    def _wait(
+        self, timer: Timer, inotify: Optional[Inotify], signals: int, events
+    ) -> bool:
+        """Waits for the next config entry, config file
+        modification or brightness change.
+
+        Returns False if a termination signal was received.
+        """
+        timer.set(self._deadline())
+
+        for fd, _ in events.poll():
+            if fd == signals:
+                for signum in read(signals, 64):
+                    if signum in TERMINATION_SIGNALS:
+                        LOGGER.info("Received %s.", Signals(signum).name)
+                        return False
+            elif fd == timer.fileno():
+                timer.read()
+            elif inotify is not None and fd == inotify.fileno():
+                inotify.read()
+                self._reload()
+            else:
+                self._changed()
+
+        return True
+
     def spawn(self):
         """Spawns the daemon."""
         self._startup()
+        events = poll()
 
-        while True:
-            now = stripped_datetime()
+        # The kernel notifies about changes of the actual brightness,
+        # e.g. by hotkeys, via POLLPRI on the sysfs attribute.
+        if self.notified:
+            events.register(self._backlight, POLLPRI)
 
-            if self._last is None or now > self._last:
-                with suppress(KeyError):
-                    self.brightness = self.config[now.time()]
+        with ExitStack() as stack:
+            timer = stack.enter_context(Timer())
+            signals = stack.enter_context(termination_signals())
+            events.register(timer)
+            events.register(signals)
 
-                self._last = now
+            if (inotify := self._watch_config()) is not None:
+                stack.enter_context(inotify)
+                events.register(inotify)
 
-            try:
-                sleep(self.tick)
-            except KeyboardInterrupt:
-                break
+            while self._wait(timer, inotify, signals, events):
+                self._update()
 
         return self._shutdown()
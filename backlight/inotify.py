@@ -0,0 +1,57 @@
+"""File system change notifications."""
+
+from ctypes import CDLL, get_errno
+from os import O_CLOEXEC, O_NONBLOCK, close, fsencode, read
+from pathlib import Path
+
+
+__all__ = ["IN_CLOSE_WRITE", "IN_MOVED_TO", "Inotify"]
+
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+LIBC = CDLL(None, use_errno=True)
+
+
+class Inotify:
+    """An inotify instance."""
+
+    def __init__(self):
+        """Creates a non-blocking inotify file descriptor."""
+        if (fd := LIBC.inotify_init1(O_NONBLOCK | O_CLOEXEC)) < 0:
+            raise OSError(get_errno(), "inotify_init1() failed")
+
+        self._fd = fd
+
+    def __enter__(self):
+        """Returns the inotify instance."""
+        return self
+
+    def __exit__(self, *_):
+        """Closes the inotify instance."""
+        self.close()
+
+    def fileno(self) -> int:
+        """Returns the inotify instance's file descriptor."""
+        return self._fd
+
+    def watch(self, path: Path, mask: int) -> int:
+        """Watches the given path for the given events."""
+        wd = LIBC.inotify_add_watch(self._fd, fsencode(path), mask)
+
+        if wd < 0:
+            raise OSError(get_errno(), "inotify_add_watch() failed", str(path))
+
+        return wd
+
+    def read(self) -> None:
+        """Discards all pending events."""
+        try:
+            while read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Closes the inotify file descriptor."""
+        close(self._fd)
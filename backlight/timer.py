@@ -0,0 +1,75 @@
+"""Absolute wall clock timers."""
+
+from ctypes import CDLL, Structure, byref, c_long, get_errno
+from datetime import datetime
+from os import O_CLOEXEC, close, read
+from sys import byteorder
+
+
+__all__ = ["Timer"]
+
+
+CLOCK_REALTIME = 0
+LIBC = CDLL(None, use_errno=True)
+TFD_TIMER_ABSTIME = 1
+
+
+class Timespec(Structure):
+    """A POSIX timespec structure."""
+
+    _fields_ = [("tv_sec", c_long), ("tv_nsec", c_long)]
+
+    @classmethod
+    def from_datetime(cls, timestamp: datetime):
+        """Creates a timespec from a datetime object."""
+        seconds, fraction = divmod(timestamp.timestamp(), 1)
+        return cls(int(seconds), int(fraction * 1_000_000_000))
+
+
+class Itimerspec(Structure):
+    """A POSIX itimerspec structure."""
+
+    _fields_ = [("it_interval", Timespec), ("it_value", Timespec)]
+
+
+class Timer:
+    """A timer file descriptor on the wall clock.
+
+    Since the timer is armed on CLOCK_REALTIME with an absolute
+    deadline, the kernel adjusts it to changes of the system clock.
+    The timer becomes readable once the deadline has passed.
+    """
+
+    def __init__(self):
+        """Creates the timer file descriptor."""
+        if (fd := LIBC.timerfd_create(CLOCK_REALTIME, O_CLOEXEC)) < 0:
+            raise OSError(get_errno(), "timerfd_create() failed")
+
+        self._fd = fd
+
+    def __enter__(self):
+        """Returns the timer."""
+        return self
+
+    def __exit__(self, *_):
+        """Closes the timer."""
+        self.close()
+
+    def fileno(self) -> int:
+        """Returns the timer's file descriptor."""
+        return self._fd
+
+    def set(self, deadline: datetime) -> None:
+        """Arms the timer to expire at the given deadline."""
+        spec = Itimerspec(Timespec(), Timespec.from_datetime(deadline))
+
+        if LIBC.timerfd_settime(self._fd, TFD_TIMER_ABSTIME, byref(spec), None):
+            raise OSError(get_errno(), "timerfd_settime() failed")
+
+    def read(self) -> int:
+        """Returns the amount of expirations since the last read."""
+        return int.from_bytes(read(self._fd, 8), byteorder)
+
+    def close(self) -> None:
+        """Closes the timer file descriptor."""
+        close(self._fd)
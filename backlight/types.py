@@ -18,9 +18,9 @@ class IntegerDifferential(int):
 
     def __new__(cls, value):
         if isinstance(value, str):
-            value = value.strip()
-            increase = value.startswith("+")
-            decrease = value.startswith("-")
+            sign = value.lstrip()[:1]
+            increase = sign == "+"
+            decrease = sign == "-"
         else:
             increase = None
             decrease = None
@@ -34,7 +34,7 @@ class IntegerDifferential(int):
 class PercentageMap(dict):
     """Range of brightness raw and percentage values."""
 
-    __slots__ = ()
+    __slots__ = ("_raw_values", "_percentages")
 
     def __init__(self, raw, percent=range(0, 101)):
         """Sets raw and percentage ranges."""
@@ -49,17 +49,32 @@ class PercentageMap(dict):
             self[raw_value] = range(round(percentage), round(next_percentage))
             percentage = next_percentage
 
+        # Lookup tables for both directions.
+        self._raw_values = {
+            percentage: raw_value
+            for raw_value, percent in self.items()
+            for percentage in percent
+        }
+        self._percentages = {
+            raw_value: sum(percent) / len(percent)
+            for raw_value, percent in self.items()
+            if percent
+        }
+
     def from_percent(self, percentage):
         """Returns the raw value for the given percentage."""
-        for raw, percent in self.items():
-            if percentage in percent:
-                return raw
+        try:
+            return self._raw_values[percentage]
+        except KeyError:
+            raise ValueError(percentage) from None
 
-        raise ValueError(percentage)
+    def to_percent(self, raw):
+        """Returns the mean percentage of the given raw value."""
+        return self._percentages[raw]
 
 
 class TimedBrightness(NamedTuple):
-    """Brightness at a specific time setting."""
+    """Brightness at a specific minute of the day."""
 
-    timestamp: str
+    timestamp: int
     brightness: int
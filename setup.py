@@ -13,6 +13,7 @@ setup(
     maintainer_email="<r.neumann@homeinfo.de>",
     license="GPLv3",
     packages=["backlight", "backlight.api"],
+    extras_require={"orjson": ["orjson"]},
     entry_points={
         "console_scripts": [
             "backlight = backlight.cli:main",